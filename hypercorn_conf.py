@@ -0,0 +1,15 @@
+"""
+Hypercorn configuration for the mock satellite API
+Usage: hypercorn -c file:hypercorn_conf.py mock_backend:app
+"""
+
+import importlib.util
+
+bind = ["127.0.0.1:8080"]
+
+# A single worker: the mock catalog, positions and tick live in module state,
+# so extra workers would each serve a different, independently moving catalog.
+# One event loop (on uvloop when installed) handles many concurrent clients.
+# The position tick is an asyncio task, so the trio worker class won't work.
+worker_class = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+workers = 1
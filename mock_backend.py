@@ -2,18 +2,60 @@
 """
 Mock Satellite API Backend Server
 Provides the same endpoints as the Rust backend for frontend testing
+
+Install dependencies: pip install -r requirements-mock.txt
+Run with: hypercorn -c file:hypercorn_conf.py mock_backend:app
+Or use scripts/run_mock_backend.sh for the Quart dev server (DEV=1)
 """
 
-from flask import Flask, jsonify, request
-from flask_cors import CORS
-import json
+from quart import Quart, Response, g, request
+from quart_cors import cors
+import asyncio
+import brotli
+import gzip
+import hashlib
+import os
 import random
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import math
+import sys
+import numpy as np
+import orjson
+import ormsgpack
+from werkzeug.routing import BaseConverter, ValidationError
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows); use the stock loop
+    uvloop = None
+
+app = cors(Quart(__name__))  # Enable CORS for all routes
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+# Response formats; clients that send Accept: application/msgpack get msgpack
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# Compress bodies of these types of at least COMPRESS_MIN_SIZE bytes, preferring brotli
+COMPRESSIBLE_MIMETYPES = {JSON_MIMETYPE, MSGPACK_MIMETYPE}
+COMPRESS_MIN_SIZE = 256
+BROTLI_QUALITY = 4
+GZIP_LEVEL = 6
+
+# Cache-Control per endpoint for the near-static and polled responses
+CACHE_CONTROL = {
+    'health_check': 'max-age=5',
+    'get_statistics': 'max-age=1',
+    'get_all_satellites': 'max-age=1, stale-while-revalidate=5',
+}
 
 # Mock satellite data
 MOCK_SATELLITES = [
@@ -32,8 +74,7 @@ MOCK_SATELLITES = [
             "y": random.uniform(-7.5, 7.5),
             "z": random.uniform(-7.5, 7.5)
         },
-        "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"]),
-        "last_updated": datetime.now().isoformat()
+        "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"])
     },
     {
         "norad_id": 43013,
@@ -50,8 +91,7 @@ MOCK_SATELLITES = [
             "y": random.uniform(-7.6, 7.6),
             "z": random.uniform(-7.6, 7.6)
         },
-        "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"]),
-        "last_updated": datetime.now().isoformat()
+        "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"])
     },
     {
         "norad_id": 48274,
@@ -68,122 +108,394 @@ MOCK_SATELLITES = [
             "y": random.uniform(-3.8, 3.8),
             "z": random.uniform(-3.8, 3.8)
         },
-        "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"]),
-        "last_updated": datetime.now().isoformat()
+        "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"])
     }
 ]
 
+rng = np.random.default_rng()
+
+# Categorical label tables; handlers sample them in one rng.choice call per field
+RISK_LABELS = np.array(["LOW", "MEDIUM", "HIGH"])
+SEV_LABELS = np.array(["LOW", "MEDIUM", "HIGH", "CRITICAL"])
+ALERT_TYPES = np.array(["conjunction", "debris", "solar_storm", "anomaly"])
+ALERT_MESSAGES = np.array(["Potential conjunction detected", "Anomalous behavior observed", "Space weather alert"])
+IMPACT_LABELS = np.array(["positive", "negative"])
+
+# Columnar satellite state, one record per satellite aligned by index with
+# MOCK_SATELLITES; risk is a code indexing RISK_LABELS. The dicts keep only the
+# static metadata (norad_id, name, TLEs); responses rebuild the rest per row.
+SAT_DTYPE = np.dtype([
+    ('norad_id', 'i8'),
+    ('lat', 'f8'), ('lon', 'f8'), ('alt', 'f8'),
+    ('vx', 'f8'), ('vy', 'f8'), ('vz', 'f8'),
+    ('risk', 'i1')
+])
+SATS = np.rec.array([
+    (
+        s["norad_id"],
+        s["position"]["latitude"], s["position"]["longitude"], s["position"]["altitude"],
+        s["velocity"]["x"], s["velocity"]["y"], s["velocity"]["z"],
+        RISK_LABELS.tolist().index(s["risk_level"])
+    )
+    for s in MOCK_SATELLITES
+], dtype=SAT_DTYPE)
+
+for satellite in MOCK_SATELLITES:
+    del satellite["position"], satellite["velocity"], satellite["risk_level"]
+
+# Pre-serialized static fields (norad_id, name, TLEs) per row, without the outer braces
+STATIC_BYTES = [orjson.dumps(s)[1:-1] for s in MOCK_SATELLITES]
+
+# NORAD ID -> row index into MOCK_SATELLITES / SATS; keep in sync if the catalog changes
+SAT_BY_NORAD = {norad_id: i for i, norad_id in enumerate(SATS.norad_id.tolist())}
+last_updated = datetime.now(timezone.utc).isoformat()
+positions_version = 0
+
+# A background task advances positions on a fixed tick; handlers only read.
+# Both run on the same event loop, so a snapshot never sees a half-applied tick.
+POSITION_TICK_SECONDS = 1.0
+_tick_task = None
+
+# mimetype -> (positions_version, body, etag) of the last rendered /api/v1/satellites payload
+_satellites_cache = {}
+
+# (mimetype, encoding) -> (etag, compressed body) so each tick compresses a variant at most once
+_encoded_cache = {}
+
+# One bounded queue per open /api/v1/alerts/stream connection, fed by the tick
+ALERT_QUEUE_SIZE = 100
+ALERT_KEEPALIVE_SECONDS = 15.0
+_alert_subscribers = set()
+
+class SatConverter(BaseConverter):
+    """Resolve a NORAD ID URL segment to its catalog row, failing the match for unknown IDs"""
+    regex = r"\d+"
+
+    def to_python(self, value):
+        row = SAT_BY_NORAD.get(int(value))
+        if row is None:
+            raise ValidationError()
+        return row
+
+    def to_url(self, row):
+        return str(MOCK_SATELLITES[row]["norad_id"])
+
+app.url_map.converters['sat'] = SatConverter
+
+def _negotiate():
+    """Pick the response mimetype from the Accept header, defaulting to JSON"""
+    return request.accept_mimetypes.best_match([JSON_MIMETYPE, MSGPACK_MIMETYPE], JSON_MIMETYPE)
+
+def _json(obj, status=200):
+    """Serialize obj into a JSON response, or msgpack when the client asks for it"""
+    mimetype = _negotiate()
+    if mimetype == MSGPACK_MIMETYPE:
+        body = ormsgpack.packb(obj, option=ormsgpack.OPT_SERIALIZE_NUMPY)
+    else:
+        body = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    response = Response(body, status=status, mimetype=mimetype)
+    response.vary.add('Accept')
+    return response
+
 def update_satellite_positions():
     """Simulate satellite movement by updating positions"""
-    for satellite in MOCK_SATELLITES:
-        # Simulate orbital movement
-        satellite["position"]["latitude"] += random.uniform(-0.1, 0.1)
-        satellite["position"]["longitude"] += random.uniform(-0.5, 0.5)
-        satellite["position"]["altitude"] += random.uniform(-1, 1)
+    global last_updated, positions_version
+    # Simulate orbital movement
+    deltas = rng.uniform(low=[-0.1, -0.5, -1.0], high=[0.1, 0.5, 1.0], size=(len(SATS), 3))
+    lat, lon, alt = SATS.lat, SATS.lon, SATS.alt
+    lat += deltas[:, 0]
+    lon += deltas[:, 1]
+    alt += deltas[:, 2]
+    
+    # Keep coordinates in valid ranges; +540 keeps the fmod argument positive so it matches %
+    np.clip(lat, -90, 90, out=lat)
+    lon[:] = np.fmod(lon + 540.0, 360.0) - 180.0
+    np.maximum(alt, 100, out=alt)
+    
+    last_updated = datetime.now(timezone.utc).isoformat()
+    positions_version += 1
+
+async def _tick_loop():
+    """Advance positions every POSITION_TICK_SECONDS for the life of the process"""
+    while True:
+        await asyncio.sleep(POSITION_TICK_SECONDS)
+        update_satellite_positions()
+        if _alert_subscribers:
+            _publish_alerts(_generate_alerts(last_updated))
+
+def _generate_alerts(timestamp):
+    """Generate random alerts, drawing each field for all alerts at once"""
+    n = int(rng.integers(0, 3))
+    types = rng.choice(ALERT_TYPES, size=n).tolist()
+    severities = rng.choice(SEV_LABELS, size=n).tolist()
+    satellite_ids = rng.choice(SATS.norad_id, size=n).tolist()
+    messages = rng.choice(ALERT_MESSAGES, size=n).tolist()
+    
+    alert_prefix = f"alert_{int(time.time())}_"
+    return [
+        {
+            "id": alert_prefix + str(i),
+            "type": types[i],
+            "severity": severities[i],
+            "satellite_id": satellite_ids[i],
+            "message": f"Mock alert {i + 1} - {messages[i]}",
+            "timestamp": timestamp,
+            "acknowledged": False
+        }
+        for i in range(n)
+    ]
+
+def _publish_alerts(alerts):
+    """Queue alerts for every stream subscriber, dropping the oldest for clients that fall behind"""
+    for queue in _alert_subscribers:
+        for alert in alerts:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(alert)
+
+async def _alert_stream(queue):
+    """Yield queued alerts as SSE 'alert' events (as the Rust backend does), with a keepalive comment while idle"""
+    try:
+        while True:
+            try:
+                alert = await asyncio.wait_for(queue.get(), ALERT_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            yield b"event: alert\ndata: " + orjson.dumps(alert) + b"\n\n"
+    finally:
+        _alert_subscribers.discard(queue)
+
+def _snapshot():
+    """Return (positions_version, copy of SATS, last_updated) as of the latest tick"""
+    return positions_version, SATS.copy(), last_updated
+
+def _satellite_dynamic(i, sats, updated_at):
+    """Build the fields of the satellite at row i of sats that change between ticks"""
+    _, lat, lon, alt, x, y, z, risk = sats[i].item()
+    return {
+        "position": {"latitude": lat, "longitude": lon, "altitude": alt},
+        "velocity": {"x": x, "y": y, "z": z},
+        "risk_level": RISK_LABELS[risk],
+        "last_updated": updated_at
+    }
+
+def _satellite_record(i, sats, updated_at):
+    """Build the response dict for the satellite at row i of sats"""
+    return {**MOCK_SATELLITES[i], **_satellite_dynamic(i, sats, updated_at)}
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _propagate_kernel(lat, lon, alt, time_diffs, rand_scales):
+    """Advance the lat/lon/alt columns in place by each satellite's time offset"""
+    for i in prange(lat.shape[0]):
+        time_diff = time_diffs[i]
+        new_lat = lat[i] + time_diff * 0.001 * rand_scales[i, 0]
+        new_lon = lon[i] + time_diff * 0.005 * rand_scales[i, 1]
+        new_alt = alt[i] + time_diff * 0.0001 * rand_scales[i, 2]
+        
+        # Keep in valid ranges
+        lat[i] = max(-90.0, min(90.0, new_lat))
+        lon[i] = np.fmod(new_lon + 540.0, 360.0) - 180.0
+        alt[i] = max(100.0, new_alt)
+
+def _render_satellites_cached(mimetype):
+    """Return (body, etag) for the satellites payload, re-rendering only when positions changed"""
+    version, body, etag = _satellites_cache.get(mimetype, (None, b"", ""))
+    if version != positions_version:
+        version, sats, updated_at = _snapshot()
+        summary = {
+            "total_count": len(MOCK_SATELLITES),
+            "timestamp": g.now_iso
+        }
         
-        # Keep coordinates in valid ranges
-        satellite["position"]["latitude"] = max(-90, min(90, satellite["position"]["latitude"]))
-        satellite["position"]["longitude"] = ((satellite["position"]["longitude"] + 180) % 360) - 180
-        satellite["position"]["altitude"] = max(100, satellite["position"]["altitude"])
+        if mimetype == MSGPACK_MIMETYPE:
+            body = ormsgpack.packb({
+                "satellites": [_satellite_record(i, sats, updated_at) for i in range(len(MOCK_SATELLITES))],
+                **summary
+            })
+        else:
+            # Stitch each pre-serialized static half to its freshly encoded dynamic half
+            satellites = b",".join(
+                b"{" + STATIC_BYTES[i] + b"," + orjson.dumps(_satellite_dynamic(i, sats, updated_at))[1:-1] + b"}"
+                for i in range(len(MOCK_SATELLITES))
+            )
+            body = b'{"satellites":[' + satellites + b"]," + orjson.dumps(summary)[1:]
         
-        satellite["last_updated"] = datetime.now().isoformat()
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        _satellites_cache[mimetype] = (version, body, etag)
+    return body, etag
+
+@app.before_serving
+async def _start_ticking():
+    """Compile the propagation kernel and start the position tick task alongside the server"""
+    global _tick_task
+    # Compile for the same array layouts propagate_satellites passes (strided SATS
+    # columns) before serving, so no request blocks the loop on JIT compilation
+    warmup = SATS.copy()
+    _propagate_kernel(warmup.lat, warmup.lon, warmup.alt, np.zeros(len(warmup)), np.zeros((len(warmup), 3)))
+    
+    _tick_task = asyncio.create_task(_tick_loop())
+
+@app.after_serving
+async def _stop_ticking():
+    """Cancel the position tick task on shutdown"""
+    _tick_task.cancel()
+
+@app.before_request
+def _stamp():
+    """Take the request timestamp once so handlers share a single clock read"""
+    g.now = datetime.now(timezone.utc)
+    g.now_iso = g.now.isoformat()
+
+@app.after_request
+def _cache_headers(response):
+    """Attach Cache-Control to the endpoints listed in CACHE_CONTROL"""
+    cache_control = CACHE_CONTROL.get(request.endpoint)
+    if cache_control:
+        response.headers['Cache-Control'] = cache_control
+    return response
+
+def _encode(body, encoding, mimetype, etag):
+    """Compress body, reusing the last result for the same ETagged variant"""
+    key = (mimetype, encoding)
+    if etag:
+        cached_etag, encoded = _encoded_cache.get(key, (None, b""))
+        if cached_etag == etag:
+            return encoded
+    
+    if encoding == 'br':
+        encoded = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        encoded = gzip.compress(body, compresslevel=GZIP_LEVEL)
+    if etag:
+        _encoded_cache[key] = (etag, encoded)
+    return encoded
+
+@app.after_request
+async def _compress(response):
+    """Brotli- or gzip-encode JSON and msgpack bodies when the client accepts it"""
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES or 'Content-Encoding' in response.headers:
+        return response
+    
+    # Vary and ETag are set before the status check so a 304 matches the 200 it stands in for
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(['br', 'gzip'])
+    if encoding is None:
+        return response
+    
+    # The encoded bytes differ, but the representation is the same, so keep the ETag as weak
+    etag, _ = response.get_etag()
+    if etag:
+        response.set_etag(etag, weak=True)
+    
+    if response.status_code != 200:
+        return response
+    body = await response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(_encode(body, encoding, response.mimetype, etag))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+@app.errorhandler(404)
+async def not_found(error):
+    """Return 404s as JSON, with the Rust backend's message for unknown NORAD IDs"""
+    if request.path.startswith('/api/v1/satellite/'):
+        return _json({"error": "Satellite not found"}, 404)
+    return _json({"error": "Not found"}, 404)
 
 @app.route('/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return _json({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": g.now_iso,
         "service": "Mock Satellite API",
         "version": "1.0.0"
     })
 
 @app.route('/api/v1/satellites', methods=['GET'])
-def get_all_satellites():
+async def get_all_satellites():
     """Get all satellites"""
-    update_satellite_positions()
-    return jsonify({
-        "satellites": MOCK_SATELLITES,
-        "total_count": len(MOCK_SATELLITES),
-        "timestamp": datetime.now().isoformat()
-    })
+    mimetype = _negotiate()
+    body, etag = _render_satellites_cached(mimetype)
+    
+    # Turns into an empty 304 when If-None-Match carries the current ETag
+    response = Response(body, mimetype=mimetype)
+    response.vary.add('Accept')
+    response.set_etag(etag)
+    return await response.make_conditional(request)
 
-@app.route('/api/v1/satellite/<int:norad_id>', methods=['GET'])
-def get_satellite(norad_id):
+@app.route('/api/v1/satellite/<sat:row>', methods=['GET'])
+async def get_satellite(row):
     """Get specific satellite by NORAD ID"""
-    update_satellite_positions()
-    satellite = next((s for s in MOCK_SATELLITES if s["norad_id"] == norad_id), None)
-    
-    if not satellite:
-        return jsonify({"error": "Satellite not found"}), 404
-    
-    return jsonify(satellite)
+    _, sats, updated_at = _snapshot()
+    return _json(_satellite_record(row, sats, updated_at))
 
 @app.route('/api/v1/statistics', methods=['GET'])
-def get_statistics():
+async def get_statistics():
     """Get satellite statistics"""
     total_satellites = len(MOCK_SATELLITES)
-    risk_counts = {"LOW": 0, "MEDIUM": 0, "HIGH": 0}
+    counts = np.bincount(SATS.risk, minlength=len(RISK_LABELS)).tolist()
+    risk_counts = dict(zip(RISK_LABELS.tolist(), counts))
     
-    for satellite in MOCK_SATELLITES:
-        risk_counts[satellite["risk_level"]] += 1
-    
-    return jsonify({
+    return _json({
         "total_satellites": total_satellites,
         "risk_distribution": risk_counts,
         "active_alerts": random.randint(0, 5),
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": g.now_iso,
         "tracking_accuracy": round(random.uniform(95.5, 99.9), 1)
     })
 
 @app.route('/api/v1/satellites/propagate', methods=['GET'])
-def propagate_satellites():
+async def propagate_satellites():
     """Propagate satellite positions to a future time"""
-    target_time = request.args.get('time', datetime.now().isoformat())
+    target_time = request.args.get('time', g.now_iso)
     
-    update_satellite_positions()
+    # The snapshot is a private copy, so propagate it in place
+    _, propagated, updated_at = _snapshot()
     
     # Simulate propagation by slightly modifying positions
-    propagated_satellites = []
-    for satellite in MOCK_SATELLITES:
-        propagated = satellite.copy()
-        propagated["position"] = satellite["position"].copy()
-        
-        # Simulate future position
-        time_diff = random.uniform(0, 3600)  # Up to 1 hour in the future
-        propagated["position"]["latitude"] += time_diff * 0.001 * random.uniform(-1, 1)
-        propagated["position"]["longitude"] += time_diff * 0.005 * random.uniform(-1, 1)
-        propagated["position"]["altitude"] += time_diff * 0.0001 * random.uniform(-1, 1)
-        
-        # Keep in valid ranges
-        propagated["position"]["latitude"] = max(-90, min(90, propagated["position"]["latitude"]))
-        propagated["position"]["longitude"] = ((propagated["position"]["longitude"] + 180) % 360) - 180
-        propagated["position"]["altitude"] = max(100, propagated["position"]["altitude"])
-        
-        propagated["predicted_time"] = target_time
-        propagated_satellites.append(propagated)
+    n = len(propagated)
+    time_diffs = rng.uniform(0, 3600, n)  # Up to 1 hour in the future
+    rand_scales = rng.uniform(-1, 1, (n, 3))
+    _propagate_kernel(propagated.lat, propagated.lon, propagated.alt, time_diffs, rand_scales)
+    
+    propagated_satellites = [
+        {**_satellite_record(i, propagated, updated_at), "predicted_time": target_time}
+        for i in range(n)
+    ]
     
-    return jsonify({
+    return _json({
         "satellites": propagated_satellites,
         "target_time": target_time,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": g.now_iso
     })
 
 @app.route('/api/v1/conjunctions/analyze', methods=['POST'])
-def analyze_conjunctions():
+async def analyze_conjunctions():
     """Analyze potential satellite conjunctions"""
-    request_data = request.get_json() or {}
+    request_data = await request.get_json() or {}
     
     # Mock conjunction analysis
     conjunctions = []
     
-    # Generate random conjunction events
-    for i in range(random.randint(0, 3)):
-        primary_sat = random.choice(MOCK_SATELLITES)
-        secondary_sat = random.choice([s for s in MOCK_SATELLITES if s != primary_sat])
+    # Generate random conjunction events, drawing each field for all events at once
+    n = int(rng.integers(0, 4))
+    hours = rng.uniform(1, 48, n).tolist()
+    miss_distances = rng.uniform(0.1, 10.0, n).round(2).tolist()  # km
+    collision_probs = rng.uniform(0.0001, 0.1, n).round(6).tolist()
+    risk_levels = rng.choice(RISK_LABELS, size=n).tolist()
+    confidences = rng.uniform(0.8, 0.99, n).round(3).tolist()
+    
+    conj_prefix = f"conj_{int(time.time())}_"
+    for i in range(n):
+        primary_sat, secondary_sat = random.sample(MOCK_SATELLITES, 2)
         
         conjunction = {
-            "id": f"conj_{int(time.time())}_{i}",
+            "id": conj_prefix + str(i),
             "primary_satellite": {
                 "norad_id": primary_sat["norad_id"],
                 "name": primary_sat["name"]
@@ -192,81 +504,64 @@ def analyze_conjunctions():
                 "norad_id": secondary_sat["norad_id"],
                 "name": secondary_sat["name"]
             },
-            "time_of_closest_approach": (datetime.now() + timedelta(hours=random.uniform(1, 48))).isoformat(),
-            "miss_distance": round(random.uniform(0.1, 10.0), 2),  # km
-            "probability_of_collision": round(random.uniform(0.0001, 0.1), 6),
-            "risk_level": random.choice(["LOW", "MEDIUM", "HIGH"]),
-            "confidence": round(random.uniform(0.8, 0.99), 3)
+            "time_of_closest_approach": (g.now + timedelta(hours=hours[i])).isoformat(),
+            "miss_distance": miss_distances[i],
+            "probability_of_collision": collision_probs[i],
+            "risk_level": risk_levels[i],
+            "confidence": confidences[i]
         }
         conjunctions.append(conjunction)
     
-    return jsonify({
+    return _json({
         "conjunctions": conjunctions,
-        "analysis_time": datetime.now().isoformat(),
+        "analysis_time": g.now_iso,
         "total_analyzed": len(MOCK_SATELLITES),
         "ai_model_version": "mock-v1.0"
     })
 
 @app.route('/api/v1/risk/predict', methods=['POST'])
-def predict_risk():
+async def predict_risk():
     """Predict collision risk"""
-    request_data = request.get_json() or {}
+    request_data = await request.get_json() or {}
     
     # Mock risk prediction
+    factors = ["Orbital Density", "Solar Activity", "Debris Environment"]
+    weights = rng.uniform(0.1, 0.9, len(factors)).round(2).tolist()
+    impacts = rng.choice(IMPACT_LABELS, size=len(factors)).tolist()
+    
     risk_prediction = {
         "satellite_id": request_data.get("satellite_id", MOCK_SATELLITES[0]["norad_id"]),
-        "predicted_risk": random.choice(["LOW", "MEDIUM", "HIGH"]),
-        "risk_score": round(random.uniform(0, 1), 3),
+        "predicted_risk": str(rng.choice(RISK_LABELS)),
+        "risk_score": round(float(rng.random()), 3),
         "contributing_factors": [
-            {
-                "factor": "Orbital Density",
-                "weight": round(random.uniform(0.1, 0.9), 2),
-                "impact": random.choice(["positive", "negative"])
-            },
-            {
-                "factor": "Solar Activity",
-                "weight": round(random.uniform(0.1, 0.9), 2),
-                "impact": random.choice(["positive", "negative"])
-            },
-            {
-                "factor": "Debris Environment",
-                "weight": round(random.uniform(0.1, 0.9), 2),
-                "impact": random.choice(["positive", "negative"])
-            }
+            {"factor": factor, "weight": weight, "impact": impact}
+            for factor, weight, impact in zip(factors, weights, impacts)
         ],
-        "prediction_time": datetime.now().isoformat(),
-        "valid_until": (datetime.now() + timedelta(hours=24)).isoformat()
+        "prediction_time": g.now_iso,
+        "valid_until": (g.now + timedelta(hours=24)).isoformat()
     }
     
-    return jsonify(risk_prediction)
+    return _json(risk_prediction)
 
 @app.route('/api/v1/alerts/stream', methods=['GET'])
-def stream_alerts():
-    """Stream alerts (simplified for mock)"""
-    alerts = []
+async def stream_alerts():
+    """Stream alerts as Server-Sent Events"""
+    queue = asyncio.Queue(ALERT_QUEUE_SIZE)
+    _alert_subscribers.add(queue)
     
-    # Generate random alerts
-    for i in range(random.randint(0, 2)):
-        alert = {
-            "id": f"alert_{int(time.time())}_{i}",
-            "type": random.choice(["conjunction", "debris", "solar_storm", "anomaly"]),
-            "severity": random.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"]),
-            "satellite_id": random.choice(MOCK_SATELLITES)["norad_id"],
-            "message": f"Mock alert {i + 1} - {random.choice(['Potential conjunction detected', 'Anomalous behavior observed', 'Space weather alert'])}",
-            "timestamp": datetime.now().isoformat(),
-            "acknowledged": False
-        }
-        alerts.append(alert)
-    
-    return jsonify({
-        "alerts": alerts,
-        "timestamp": datetime.now().isoformat()
-    })
+    response = Response(_alert_stream(queue), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.timeout = None  # The stream stays open until the client disconnects
+    return response
 
 if __name__ == '__main__':
+    if not os.environ.get("DEV"):
+        sys.exit("Run under hypercorn: hypercorn -c file:hypercorn_conf.py mock_backend:app (or set DEV=1 for the Quart dev server)")
+    
     print("🛰️ Starting Mock Satellite API Server...")
     print("📡 Server will be available at http://localhost:8080")
     print("🔄 Providing mock data for frontend testing")
     print("⚡ Press Ctrl+C to stop")
     
-    app.run(host='127.0.0.1', port=8080, debug=True)
\ No newline at end of file
+    loop = uvloop.new_event_loop() if uvloop else None
+    app.run(host='127.0.0.1', port=8080, debug=False, use_reloader=False, loop=loop)
\ No newline at end of file
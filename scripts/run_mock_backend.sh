@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+# Start the mock satellite API on the Quart dev server.
+# Dependencies: pip install -r requirements-mock.txt
+# -OO strips asserts and docstrings; -X no_debug_ranges drops per-instruction column tables.
+cd "$(dirname "$0")/.." || exit 1
+DEV=1 exec python -OO -X no_debug_ranges mock_backend.py
@@ -0,0 +1,89 @@
+"""
+Client-visible behaviour of the mock satellite API (mock_backend.py)
+Run with: python -m pytest tests/test_mock_backend.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+import ormsgpack
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import mock_backend  # noqa: E402
+
+
+def run_with_client(check):
+    """Run the async check(client) against a started app (before_serving hooks included)"""
+    async def main():
+        async with mock_backend.app.test_app() as test_app:
+            await check(test_app.test_client())
+    asyncio.run(main())
+
+
+def test_satellites_etag_returns_304():
+    async def check(client):
+        first = await client.get('/api/v1/satellites')
+        assert first.status_code == 200
+        etag = first.headers['ETag']
+
+        second = await client.get('/api/v1/satellites', headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert await second.get_data() == b""
+    run_with_client(check)
+
+
+def test_unknown_norad_id_returns_404():
+    async def check(client):
+        response = await client.get('/api/v1/satellite/1')
+        assert response.status_code == 404
+        assert orjson.loads(await response.get_data()) == {"error": "Satellite not found"}
+
+        response = await client.get('/no/such/route')
+        assert response.status_code == 404
+        assert orjson.loads(await response.get_data()) == {"error": "Not found"}
+    run_with_client(check)
+
+
+def test_msgpack_accept_round_trips():
+    async def check(client):
+        for path in ['/api/v1/satellites', '/api/v1/satellite/25544', '/api/v1/statistics']:
+            response = await client.get(path, headers={'Accept': 'application/msgpack'})
+            assert response.status_code == 200
+            assert response.mimetype == 'application/msgpack'
+
+            payload = ormsgpack.unpackb(await response.get_data())
+            json_payload = orjson.loads(await (await client.get(path)).get_data())
+            assert payload.keys() == json_payload.keys()
+    run_with_client(check)
+
+
+def test_alert_stream_framing():
+    alert = {"id": "alert_0_0", "type": "debris", "severity": "LOW"}
+
+    async def check(client):
+        async with client.request('/api/v1/alerts/stream') as connection:
+            await connection.send_complete()
+            while not mock_backend._alert_subscribers:
+                await asyncio.sleep(0.01)
+            mock_backend._publish_alerts([alert])
+
+            chunk = b""
+            while not chunk.endswith(b"\n\n"):
+                chunk += await asyncio.wait_for(connection.receive(), 5)
+            await connection.disconnect()
+
+        assert connection.headers['Content-Type'].startswith('text/event-stream')
+        assert chunk == b"event: alert\ndata: " + orjson.dumps(alert) + b"\n\n"
+    run_with_client(check)
+
+
+def test_alert_stream_keepalive(monkeypatch):
+    monkeypatch.setattr(mock_backend, 'ALERT_KEEPALIVE_SECONDS', 0.01)
+
+    async def main():
+        stream = mock_backend._alert_stream(asyncio.Queue())
+        assert await stream.__anext__() == b": keepalive\n\n"
+        await stream.aclose()
+    asyncio.run(main())